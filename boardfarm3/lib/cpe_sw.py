@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Interface
+from time import monotonic
 from typing import TYPE_CHECKING, Any, cast
 
 import pexpect
@@ -24,6 +25,8 @@ if TYPE_CHECKING:
     from boardfarm3.lib.custom_typing.jc import ParsedPSOutput
     from boardfarm3.templates.cpe.cpe_hw import CPEHW
 
+_MEMINFO_FIELD = re.compile(r"^(\w+):\s+(\d+)", re.MULTILINE)
+
 
 # pylint: disable-next=too-many-public-methods
 class CPESwLibraries(CPESW):
@@ -246,28 +249,35 @@ class CPESwLibraries(CPESW):
     def get_memory_utilization(self) -> dict[str, int]:
         """Return current memory utilization of the cable modem.
 
+        The values are in MiB, derived from /proc/meminfo the way free does.
+
         :return: current memory utilization of cpe
         :rtype: dict[str, int]
         """
-        memory_keys = []
-        memory_val: list[str] = []
-        result = self._get_console("default_shell").execute_command("free -m")
-        if regex_match := re.search(
-            r"Mem:\s+((\d+)(\s+)(\d+)(\s+)(\d+)(\s+)(\d+)(\s+)(\d+)(\s+)(\d+))",
-            result,
-        ):
-            memory_keys = [
-                "total",
-                "used",
-                "free",
-                "shared",
-                "cache",
-                "available",
-            ]
-            memory_val = regex_match.group(1).strip().split()
-        # ignoring pylint error as fixing it would cause mypy to complain
-        # about unreachable code...
-        return dict(zip(memory_keys, map(int, memory_val)))
+        meminfo = {
+            name: int(value)
+            for name, value in _MEMINFO_FIELD.findall(
+                self._get_console("default_shell").execute_command(
+                    "cat /proc/meminfo",
+                ),
+            )
+        }
+        if "MemTotal" not in meminfo:
+            return {}
+        cache = (
+            meminfo.get("Buffers", 0)
+            + meminfo.get("Cached", 0)
+            + meminfo.get("SReclaimable", 0)
+        )
+        memory_kib = {
+            "total": meminfo["MemTotal"],
+            "used": meminfo["MemTotal"] - meminfo["MemFree"] - cache,
+            "free": meminfo["MemFree"],
+            "shared": meminfo.get("Shmem", 0),
+            "cache": cache,
+            "available": meminfo.get("MemAvailable", meminfo["MemFree"]),
+        }
+        return {key: value // 1024 for key, value in memory_kib.items()}
 
     def enable_logs(self, component: str, flag: str = "enable") -> None:
         """Enable logs for given component.
@@ -278,11 +288,18 @@ class CPESwLibraries(CPESW):
         """
         raise NotImplementedError
 
-    def get_board_logs(self, timeout: int = 300) -> str:
+    def get_board_logs(
+        self,
+        timeout: int = 300,
+        idle_timeout: float | None = None,
+    ) -> str:
         """Get the console log for the time period mentioned.
 
         :param timeout: time value to collect the logs for, defaults to 300
         :type timeout: int
+        :param idle_timeout: stop collecting once no log arrived for this many
+            seconds, defaults to None (collect for the whole timeout)
+        :type idle_timeout: float | None
         :return: Console logs for a given time period
         :rtype: str
         :raises BoardfarmException: if the console is not initialised,
@@ -290,8 +307,19 @@ class CPESwLibraries(CPESW):
         """
         if self._console:
             self._console.sendline()
-            self._console.expect(pexpect.TIMEOUT, timeout=timeout)
-            return str(self._console.before)
+            if idle_timeout is None:
+                self._console.expect(pexpect.TIMEOUT, timeout=timeout)
+                return str(self._console.before)
+            logs: list[str] = []
+            deadline = monotonic() + timeout
+            while (remaining := deadline - monotonic()) > 0:
+                self._console.expect(
+                    pexpect.TIMEOUT, timeout=min(idle_timeout, remaining)
+                )
+                if not self._console.before:
+                    break
+                logs.append(str(self._console.before))
+            return "".join(logs)
         msg = "Console obj is not initialized"
         raise BoardfarmException(msg)
 
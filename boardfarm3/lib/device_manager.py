@@ -37,6 +37,7 @@ class DeviceManager:
             msg = "DeviceManager is already initialized."  # type: ignore[unreachable]
             raise ValueError(msg)
         self._plugin_manager = plugin_manager
+        self._device_by_type_cache: dict[type, Any] = {}
         _DEVICE_MANAGER_INSTANCE = self
 
     def get_devices_by_type(self, device_type: type[T]) -> dict[str, T]:
@@ -55,13 +56,17 @@ class DeviceManager:
         """Get first device of the given type.
 
         In order to get all devices of given type use get_devices_by_type.
+        The lookup result is cached until a device is (un)registered.
 
         :param device_type: device type
         :returns: device of given type
         :raises DeviceNotFound: when device of given type not available
         """
+        if device_type in self._device_by_type_cache:
+            return self._device_by_type_cache[device_type]
         for _, plugin in self._plugin_manager.list_name_plugin():
             if isinstance(plugin, device_type):
+                self._device_by_type_cache[device_type] = plugin
                 return plugin
         msg = f"No device available of type {device_type}"
         raise DeviceNotFound(msg)
@@ -83,6 +88,7 @@ class DeviceManager:
             _get_attribute_with_ignore_exception,
         ):
             self._plugin_manager.register(device, device.device_name)
+        self._device_by_type_cache.clear()
 
     def unregister_device(self, device_name: str) -> None:
         """Unregister a device from boardfarm.
@@ -90,6 +96,7 @@ class DeviceManager:
         :param device_name: name of device to unregister
         """
         self._plugin_manager.set_blocked(device_name)
+        self._device_by_type_cache.clear()
 
 
 def get_device_manager() -> DeviceManager:
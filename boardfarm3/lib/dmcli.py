@@ -9,6 +9,15 @@ from time import sleep
 from boardfarm3.exceptions import BoardfarmException
 from boardfarm3.lib.boardfarm_pexpect import BoardfarmPexpect
 
+# Printed after every dmcli command of a batch to split the combined output
+_BATCH_SEPARATOR = "---BF-DMCLI---"
+_BATCH_SEPARATOR_LINE = re.compile(rf"^{_BATCH_SEPARATOR}\r?$", re.MULTILINE)
+_BATCH_COMMAND = (
+    "for p in {}; do dmcli eRT getv $p; echo " + _BATCH_SEPARATOR + "; done"
+)
+# Keep the batch command echo on a single console line, it is matched verbatim
+_BATCH_COMMAND_MAX_LEN = 150
+
 
 class DMCLIError(BoardfarmException):
     """Raise this on DMCLI command line utility errors."""
@@ -47,6 +56,12 @@ class DMCLIAPI:
             timeout=60,
         )
         sleep(sleep_timeout)
+        return self._parse_dmcli_output(operation, param, command_output)
+
+    @staticmethod
+    def _parse_dmcli_output(
+        operation: str, param: str, command_output: str
+    ) -> DMCLIOut:
         regex_match = re.search(
             r"Execution (fail|succeed)(.*)|(Can't find destination component)",
             command_output,
@@ -103,6 +118,51 @@ class DMCLIAPI:
         """
         return self._trigger_dmcli_cmd("getvalues", param)
 
+    def GPV_batch(  # pylint: disable=invalid-name
+        self, params: list[str]
+    ) -> dict[str, DMCLIOut]:
+        """Get given parameter values via dmcli in batched console commands.
+
+        The params are split into chunks so that each command stays shorter
+        than the console width.
+
+        :param params: params to get
+        :type params: list[str]
+        :return: dmcli output object per param
+        :rtype: dict[str, DMCLIOut]
+        :raises DMCLIError: if the output of a param is missing
+        """
+        result: dict[str, DMCLIOut] = {}
+        for chunk in self._batch_chunks(params):
+            command_output = self._console.execute_command(
+                _BATCH_COMMAND.format(" ".join(chunk)),
+                timeout=60 * len(chunk),
+            )
+            outputs = _BATCH_SEPARATOR_LINE.split(command_output)
+            if len(outputs) <= len(chunk):
+                raise DMCLIError("Failed to get dmcli output of all params")
+            result.update(
+                (param, self._parse_dmcli_output("getvalues", param, output))
+                for param, output in zip(chunk, outputs)
+            )
+        return result
+
+    @staticmethod
+    def _batch_chunks(params: list[str]) -> list[list[str]]:
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        for param in params:
+            if chunk and (
+                len(_BATCH_COMMAND.format(" ".join([*chunk, param])))
+                > _BATCH_COMMAND_MAX_LEN
+            ):
+                chunks.append(chunk)
+                chunk = []
+            chunk.append(param)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
     def DelObject(self, param: str) -> DMCLIOut:  # pylint: disable=invalid-name
         """Add object via dmcli.
 
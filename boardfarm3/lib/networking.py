@@ -238,6 +238,9 @@ def traceroute_host(
     )
 
 
+_IP6TABLES_SAVE_MARKER = "---BF-IP6TABLES-SAVE---"
+
+
 class IptablesFirewall:
     """Linux iptables firewall."""
 
@@ -297,6 +300,47 @@ class IptablesFirewall:
             self._console.execute_command(f"ip6tables {opts} -L {extra_opts} --line-number -nv"),
         )
 
+    def get_iptables_save(self) -> dict[str, dict[str, list[str]]]:
+        """Return the rules of all iptables tables using iptables-save.
+
+        All tables are dumped with a single command, which is cheaper than
+        listing every table separately.
+
+        :return: rules of each chain per table
+        :rtype: dict[str, dict[str, list[str]]]
+        """
+        return IptablesParser().iptables_save(
+            self._console.execute_command("iptables-save"),
+        )
+
+    def get_ip6tables_save(self) -> dict[str, dict[str, list[str]]]:
+        """Return the rules of all ip6tables tables using ip6tables-save.
+
+        :return: rules of each chain per table
+        :rtype: dict[str, dict[str, list[str]]]
+        """
+        return IptablesParser().iptables_save(
+            self._console.execute_command("ip6tables-save"),
+        )
+
+    def get_ip46tables_save(
+        self,
+    ) -> tuple[dict[str, dict[str, list[str]]], dict[str, dict[str, list[str]]]]:
+        """Return the rules of all iptables and ip6tables tables.
+
+        Both dumps are taken with a single console command, halving the
+        prompt round-trips compared to get_iptables_save/get_ip6tables_save.
+
+        :return: IPv4 and IPv6 rules of each chain per table
+        :rtype: tuple[dict[str, dict[str, list[str]]], dict[str, dict[str, list[str]]]]
+        """
+        output = self._console.execute_command(
+            f"iptables-save; echo {_IP6TABLES_SAVE_MARKER}; ip6tables-save",
+        )
+        ipv4_output, _, ipv6_output = output.partition(_IP6TABLES_SAVE_MARKER)
+        parser = IptablesParser()
+        return parser.iptables_save(ipv4_output), parser.iptables_save(ipv6_output)
+
     def get_iptables_policy(
         self,
         opts: str = "",
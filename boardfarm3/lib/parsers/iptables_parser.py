@@ -4,6 +4,11 @@ import re
 
 # TODO: Rewrite this library in a better way
 
+# Patterns are compiled once at import instead of on every parser call
+_CHAIN_SPLIT = re.compile("Chain")
+_CHAIN_NAME_LINE = re.compile(r"\s[A-Za-z]")
+_POLICY = re.compile(r"\((.*?)\)")
+
 
 class IptablesParser:
     """Parse the iptables from table format to dict."""
@@ -27,7 +32,7 @@ class IptablesParser:
         :rtype: Dict[str, List[Dict]]
         """
         headers = self._get_headers(ip_tables)
-        split_chain = re.split("Chain", ip_tables)
+        split_chain = _CHAIN_SPLIT.split(ip_tables)
         key = None
         table_rule: dict[str, list[dict]] = {}
         # pylint: disable=too-many-nested-blocks, consider-using-enumerate
@@ -35,7 +40,7 @@ class IptablesParser:
             rule_data: list[dict] = []
             for rule in split_chain[i].splitlines():
                 rule_details: dict[str, str] = {}
-                if re.match(r"\s[A-Za-z]", rule):
+                if _CHAIN_NAME_LINE.match(rule):
                     key = rule.split(" ")[1]
                 if rule[:1].isdigit():
                     values = list(rule.split())
@@ -61,7 +66,7 @@ class IptablesParser:
         """
         header = self._get_headers(ip6_tables)
         header.remove("opt")
-        split_chain = re.split("Chain", ip6_tables)
+        split_chain = _CHAIN_SPLIT.split(ip6_tables)
         key = None
         table_rule: dict[str, list[dict]] = {}
         # pylint: disable=too-many-nested-blocks, consider-using-enumerate
@@ -69,7 +74,7 @@ class IptablesParser:
             rule_data: list[dict[str, str]] = []
             for rule in split_chain[i].splitlines():
                 rule_details: dict[str, str] = {}
-                if re.match(r"\s[A-Za-z]", rule) is not None:
+                if _CHAIN_NAME_LINE.match(rule) is not None:
                     key = rule.split(" ")[1]
                 elif rule[:1].isdigit():
                     values = list(rule.split())
@@ -93,9 +98,33 @@ class IptablesParser:
         :rtype: dict[str, str]
         """
         policy_dict = {}
-        for policies in re.split(r"Chain", ip_tables):
+        for policies in _CHAIN_SPLIT.split(ip_tables):
             if len(lines := policies.strip().split("\n")) > 1:
                 policy_key = lines[0].split()[0]
-                policy_value = re.search(r"\((.*?)\)", lines[0])[1]
+                policy_value = _POLICY.search(lines[0])[1]
                 policy_dict[policy_key] = policy_value
         return policy_dict
+
+    def iptables_save(self, output: str) -> dict[str, dict[str, list[str]]]:
+        """Return parsed iptables-save/ip6tables-save output.
+
+        Every table is parsed in a single pass, the rules are kept as the
+        rule specification following ``-A <chain>``.
+
+        :param output: output of iptables-save command
+        :type output: str
+        :return: rules of each chain per table
+        :rtype: dict[str, dict[str, list[str]]]
+        """
+        tables: dict[str, dict[str, list[str]]] = {}
+        chains: dict[str, list[str]] = {}
+        for line in output.splitlines():
+            line = line.strip()
+            if line.startswith("*"):
+                chains = tables.setdefault(line[1:], {})
+            elif line.startswith(":"):
+                chains.setdefault(line[1:].split(maxsplit=1)[0], [])
+            elif line.startswith("-A "):
+                chain, _, rule = line[3:].partition(" ")
+                chains.setdefault(chain, []).append(rule)
+        return tables
@@ -255,10 +255,16 @@ class CPESW(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_board_logs(self, timeout: int = 300) -> str:
+    def get_board_logs(
+        self,
+        timeout: int = 300,
+        idle_timeout: float | None = None,
+    ) -> str:
         """Return board console logs for given timeout.
 
         :param timeout: log capture time in seconds
+        :param idle_timeout: stop capturing once the console was idle for this
+            many seconds, defaults to None (capture for the whole timeout)
         :return: captured logs
         """
         raise NotImplementedError
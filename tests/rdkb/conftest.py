@@ -1,6 +1,26 @@
 """Pytest configuration for boardfarm tests."""
 
+import json
 import logging
+from pathlib import Path
+
+import pytest
+
+from boardfarm3.templates.cpe import CPE
+
+# Probes read the capability once, a board without it raises one of
+# _CAPABILITY_ABSENT, any other error is left to fail the test
+_CAPABILITY_PROBES = {
+    "wifi": lambda board: board.sw.wifi.wlan_ifaces,
+    "tr069": lambda board: board.sw.is_tr069_connected(),
+    "ntp": lambda board: board.sw.get_ntp_sync_status(),
+}
+_CAPABILITY_ABSENT = (NotImplementedError, AttributeError)
+
+# Console read size and the buffer tail searched for the prompt, pexpect
+# otherwise rescans the whole output on every read of a long command output
+_CONSOLE_MAXREAD = 65536
+_CONSOLE_SEARCH_WINDOW = 4096
 
 
 def pytest_configure(config):
@@ -18,6 +38,12 @@ def pytest_configure(config):
 
     logging.getLogger("boardfarm3.plugins.setup_environment").setLevel(logging.ERROR)
 
+    # Registered here as well so runs without pytest-xdist do not warn
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the group on the same worker"
+    )
+
+
 def pytest_sessionstart(session):
     """Set logging levels at session start after loggers are created.
 
@@ -27,3 +53,157 @@ def pytest_sessionstart(session):
     for logger_name in logging.root.manager.loggerDict:
         if logger_name.startswith("pexpect"):
             logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+
+def _detect_board_model(config):
+    """Return the board model from the environment config, if any.
+
+    :param config: pytest config object
+    :return: board model name or None when it cannot be determined
+    """
+    env_config = config.getoption("--env-config", default=None)
+    if not env_config:
+        return None
+    try:
+        env_json = json.loads(Path(env_config).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return env_json.get("environment_def", {}).get("board", {}).get("model")
+
+
+def _env_req_matches(item, model):
+    """Check whether the env_req board model of a test matches the board.
+
+    :param item: collected test item
+    :param model: connected board model, None if unknown
+    :return: True when the test is applicable to the board
+    """
+    marker = item.get_closest_marker("env_req")
+    if marker is None or model is None or not marker.args:
+        return True
+    required = marker.args[0].get("environment_def", {}).get("board", {})
+    return required.get("model", model) == model
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests whose env_req board model does not match the board.
+
+    Filtering at collection time avoids running fixture setup for tests that
+    would be skipped by the env_req check anyway.
+
+    :param config: pytest config object
+    :param items: collected test items
+    """
+    model = _detect_board_model(config)
+    if model is None:
+        return
+    selected, deselected = [], []
+    for item in items:
+        (selected if _env_req_matches(item, model) else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def board(device_manager):
+    """Board under test, looked up once per session.
+
+    The board console is tuned for long command outputs before first use.
+
+    :param device_manager: device manager fixture
+    :return: CPE device
+    """
+    board = device_manager.get_device_by_type(CPE)
+    console = board.hw.get_console("console")
+    console.maxread = _CONSOLE_MAXREAD
+    console.searchwindowsize = _CONSOLE_SEARCH_WINDOW
+    return board
+
+
+@pytest.fixture(scope="session")
+def console(board):
+    """Serial console of the board under test.
+
+    :param board: board fixture
+    :return: board console
+    """
+    return board.hw.get_console("console")
+
+
+class BoardCapabilities:
+    """Probe board capabilities lazily, at most once per session."""
+
+    def __init__(self, board):
+        """Initialize the capabilities helper.
+
+        :param board: CPE device under test
+        """
+        self._board = board
+        self._probed = {}
+
+    def _probe(self, name):
+        """Return the probed value and why the capability is absent, if it is.
+
+        :param name: capability name, key of _CAPABILITY_PROBES
+        :return: probed value and absence reason, None when available
+        """
+        if name not in self._probed:
+            try:
+                self._probed[name] = (_CAPABILITY_PROBES[name](self._board), None)
+            except _CAPABILITY_ABSENT as exc:
+                self._probed[name] = (None, str(exc) or type(exc).__name__)
+        return self._probed[name]
+
+    def require(self, name):
+        """Skip the calling test when the capability is not available.
+
+        :param name: capability name, key of _CAPABILITY_PROBES
+        :return: value returned by the capability probe
+        """
+        value, reason = self._probe(name)
+        if reason is not None:
+            pytest.skip(f"{name} not available: {reason}")
+        return value
+
+
+@pytest.fixture(scope="session")
+def caps(board):
+    """Board capabilities shared by all tests of the session.
+
+    :param board: board fixture
+    :return: capabilities helper
+    """
+    return BoardCapabilities(board)
+
+
+@pytest.fixture
+def require_wifi(caps):
+    """Skip the test when the WiFi HAL reports no wlan interfaces.
+
+    :param caps: board capabilities fixture
+    :return: wlan interfaces read by the probe
+    """
+    if not (ifaces := caps.require("wifi")):
+        pytest.skip("wifi not available: no wlan interfaces")
+    return ifaces
+
+
+@pytest.fixture
+def require_tr069(caps):
+    """Skip the test when the TR-069 status is not available.
+
+    :param caps: board capabilities fixture
+    :return: TR-069 connection status read by the probe
+    """
+    return caps.require("tr069")
+
+
+@pytest.fixture
+def require_ntp(caps):
+    """Skip the test when the NTP sync status is not available.
+
+    :param caps: board capabilities fixture
+    :return: NTP sync status read by the probe
+    """
+    return caps.require("ntp")
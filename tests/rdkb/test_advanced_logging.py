@@ -2,13 +2,13 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_enable_component_logs(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_enable_component_logs(board):
     print("\nTesting component log enable:")
 
     try:
@@ -18,10 +18,7 @@ def test_enable_component_logs(device_manager):
         pytest.skip(f"Component logging not available: {e}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_boottime_log(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_get_boottime_log(board):
     print("\nRetrieving boot-time logs:")
 
     try:
@@ -34,10 +31,7 @@ def test_get_boottime_log(device_manager):
         pytest.skip(f"Boot-time log retrieval not available: {e}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_tr069_log(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_get_tr069_log(board):
     print("\nRetrieving TR-069 logs:")
 
     try:
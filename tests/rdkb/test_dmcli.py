@@ -2,23 +2,20 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_get_parameter_value(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_dmcli_get_parameter_value(board):
     result = board.sw.dmcli.GPV("Device.DeviceInfo.ModelName")
 
     print(f"\nDevice Model: {result.rval}")
     assert result.rval, "Should return model name"
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_set_and_get_value(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_dmcli_set_and_get_value(board):
     param = "Device.DeviceInfo.X_RDKCENTRAL-COM_DeviceFingerPrint.Enable"
 
     original = board.sw.dmcli.GPV(param)
@@ -2,20 +2,20 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_add_and_delete_object(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_dmcli_add_and_delete_object(board):
     print("\nTesting AddObject and DelObject:")
 
     try:
         result = board.sw.dmcli.AddObject("Device.DHCPv4.Server.Pool.")
         print(f"  Added object: {result.rval}")
 
-        instance_number = result.rval.split(".")[-1]
+        instance_number = result.rval.rpartition(".")[2]
         assert instance_number.isdigit(), "Should return instance number"
 
         obj_path = f"Device.DHCPv4.Server.Pool.{instance_number}"
@@ -2,14 +2,15 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
 from boardfarm3.lib.networking import dns_lookup
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_nslookup_basic(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
+def test_nslookup_basic(board):
     try:
         result = board.sw.nslookup.nslookup("google.com")
 
@@ -20,11 +21,7 @@ def test_nslookup_basic(device_manager):
         pytest.skip(f"nslookup not available: {e}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dns_lookup_dig(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-    console = board.hw.get_console("console")
-
+def test_dns_lookup_dig(console):
     try:
         result = dns_lookup(console, "google.com", "A")
 
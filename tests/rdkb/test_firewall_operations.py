@@ -2,13 +2,28 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_iptables_list(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+def _rule_sources(rules):
+    """Return the source addresses matched by iptables-save rule specs.
 
+    :param rules: rule specs of a chain, e.g. "-s 10.0.0.1/32 -j DROP"
+    :return: source addresses without prefix length
+    """
+    sources = set()
+    for rule in rules:
+        tokens = rule.split()
+        for index, token in enumerate(tokens[:-1]):
+            if token in ("-s", "--source"):
+                sources.add(tokens[index + 1].partition("/")[0])
+    return sources
+
+
+def test_get_iptables_list(board):
     rules = board.sw.firewall.get_iptables_list("", "INPUT")
 
     print(f"\nIPv4 Firewall Rules (filter/INPUT):")
@@ -19,19 +34,13 @@ def test_get_iptables_list(device_manager):
             print(f"    {i}. {rule}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_check_iptables_empty(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_check_iptables_empty(board):
     is_empty = board.sw.firewall.is_iptable_empty()
 
     print(f"\nIPv4 Firewall empty: {is_empty}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_iptables_policy(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_get_iptables_policy(board):
     policies = board.sw.firewall.get_iptables_policy("")
 
     print(f"\nIPv4 Firewall Policies (filter):")
@@ -39,29 +48,36 @@ def test_get_iptables_policy(device_manager):
         print(f"  {chain}: {policy}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_ip6tables_list(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_get_ip6tables_list(board):
     rules = board.sw.firewall.get_ip6tables_list("", "INPUT")
 
     print(f"\nIPv6 Firewall Rules (filter/INPUT):")
     print(f"  Total rules: {len(rules)}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_check_ip6tables_empty(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_check_ip6tables_empty(board):
     is_empty = board.sw.firewall.is_ip6table_empty()
 
     print(f"\nIPv6 Firewall empty: {is_empty}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_ip6tables_policy(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+def test_get_iptables_save(board):
+    tables = board.sw.firewall.get_iptables_save()
+
+    assert "filter" in tables, "iptables-save should dump the filter table"
+    print(f"\nIPv4 Firewall tables: {', '.join(tables)}")
+
 
+def test_get_ip46tables_save(board):
+    ipv4_tables, ipv6_tables = board.sw.firewall.get_ip46tables_save()
+
+    assert "filter" in ipv4_tables, "iptables-save should dump the filter table"
+    assert "filter" in ipv6_tables, "ip6tables-save should dump the filter table"
+    print(f"\nIPv4 Firewall tables: {', '.join(ipv4_tables)}")
+    print(f"IPv6 Firewall tables: {', '.join(ipv6_tables)}")
+
+
+def test_get_ip6tables_policy(board):
     policies = board.sw.firewall.get_ip6tables_policy("")
 
     print(f"\nIPv6 Firewall Policies (filter):")
@@ -69,34 +85,33 @@ def test_get_ip6tables_policy(device_manager):
         print(f"  {chain}: {policy}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_add_and_remove_drop_rule(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_add_and_remove_drop_rule(board):
     test_ip = "192.168.99.99"
     print(f"\nTesting IPv4 firewall rule add/delete for {test_ip}")
 
     board.sw.firewall.add_drop_rule_iptables("src", test_ip)
     print("  OK Added drop rule")
 
-    rules = board.sw.firewall.get_iptables_list("", "INPUT")
-    found = any(test_ip in str(rule) for chain_rules in rules.values() for rule in chain_rules)
-    if found:
+    tables = board.sw.firewall.get_iptables_save()
+    input_rules = tables.get("filter", {}).get("INPUT", [])
+    if test_ip in _rule_sources(input_rules):
         print(f"  OK Rule found in iptables")
 
     board.sw.firewall.del_drop_rule_iptables("src", test_ip)
     print("  OK Removed drop rule")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_add_and_remove_ip6_drop_rule(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_add_and_remove_ip6_drop_rule(board):
     test_ip = "2001:db8::99"
     print(f"\nTesting IPv6 firewall rule add/delete for {test_ip}")
 
     board.sw.firewall.add_drop_rule_ip6tables("src", test_ip)
     print("  OK Added drop rule")
 
+    tables = board.sw.firewall.get_ip6tables_save()
+    input_rules = tables.get("filter", {}).get("INPUT", [])
+    if test_ip in _rule_sources(input_rules):
+        print(f"  OK Rule found in ip6tables")
+
     board.sw.firewall.del_drop_rule_ip6tables("src", test_ip)
     print("  OK Removed drop rule")
@@ -1,16 +1,15 @@
 """Tests for HTTP operations on RDKB devices."""
 
 import pytest
-
-from boardfarm3.templates.cpe import CPE
 from boardfarm3.lib.networking import http_get
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_http_get_basic(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-    console = board.hw.get_console("console")
 
+def test_http_get_basic(console):
     try:
         result = http_get(console, "http://example.com", timeout=10)
 
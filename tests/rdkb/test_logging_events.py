@@ -2,14 +2,14 @@
 
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_read_event_logs(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
-    logs = board.sw.read_event_logs()
+def test_read_event_logs(board):
+    logs = list(board.sw.read_event_logs())
 
     assert len(logs) > 0, "Should have event logs"
     print(f"\nTotal event log entries: {len(logs)}")
@@ -18,22 +18,16 @@ def test_read_event_logs(device_manager):
         print(f"  {log}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_board_logs_continuous(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
-    print("\nCapturing board logs for 3 seconds:")
-    logs = board.sw.get_board_logs(timeout=3)
+def test_get_board_logs_continuous(board):
+    print("\nCapturing board logs for up to 3 seconds:")
+    logs = board.sw.get_board_logs(timeout=3, idle_timeout=0.25)
 
     assert isinstance(logs, str), "Logs should be a string"
-    lines = logs.split("\n")
-    print(f"  Captured {len(lines)} lines")
+    line_count = logs.count("\n") + 1
+    print(f"  Captured {line_count} lines")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_read_file_content(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
+def test_read_file_content(board):
     content = board.sw.get_file_content("/proc/version", timeout=5)
 
     print(f"\n/proc/version:")
@@ -41,11 +35,7 @@ def test_read_file_content(device_manager):
     assert len(content) > 0, "File should have content"
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_add_info_to_file(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-    console = board.hw.get_console("console")
-
+def test_add_info_to_file(board, console):
     test_file = "/tmp/boardfarm_test_write.txt"
     test_content = "Boardfarm test line"
 
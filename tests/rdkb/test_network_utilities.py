@@ -1,56 +1,54 @@
 """Tests for network utility primitives on RDKB devices."""
 
+import logging
+
 import pytest
-import time
 
-from boardfarm3.templates.cpe import CPE
+_LOGGER = logging.getLogger(__name__)
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_netstat_basic(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
+def test_netstat_basic(board):
     netstat_data = board.sw.nw_utility.netstat("-tuln")
 
-    print(f"\nNetstat results: {len(netstat_data)} rows")
-    print(f"Columns: {list(netstat_data.columns)}")
-
+    _LOGGER.info("Netstat results: %s rows", len(netstat_data))
+    _LOGGER.info("Columns: %s", list(netstat_data.columns))
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_tcpdump_capture(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-    console = board.hw.get_console("console")
 
-    print("\nTesting tcpdump capture:")
+def test_tcpdump_capture(board, console):
+    _LOGGER.info("Testing tcpdump capture:")
 
     try:
         pid = board.sw.nw_utility.start_tcpdump("icmp", "erouter0")
-        print(f"  Started tcpdump: PID {pid}")
+        _LOGGER.info("  Started tcpdump: PID %s", pid)
 
+        # the ping runs to completion and tcpdump -U writes every packet as
+        # it arrives, stop_tcpdump then waits for the capture summary
         console.execute_command("ping -c 3 8.8.8.8")
-        time.sleep(2)
 
         board.sw.nw_utility.stop_tcpdump(pid)
-        print(f"  Stopped tcpdump")
+        _LOGGER.info("  Stopped tcpdump")
 
         try:
             packets = board.sw.nw_utility.read_tcpdump(f"/tmp/tcpdump_{pid}.pcap")
-            print(f"  Captured {len(packets)} packets")
+            _LOGGER.info("  Captured %s packets", len(packets))
         except Exception as e:
-            print(f"  Could not read pcap: {e}")
+            _LOGGER.info("  Could not read pcap: %s", e)
     except (ValueError, Exception) as e:
         pytest.skip(f"tcpdump not available or failed to start: {e}")
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_traceroute(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
-    print("\nTraceroute to 8.8.8.8:")
+def test_traceroute(board):
+    _LOGGER.info("Traceroute to 8.8.8.8:")
     try:
-        result = board.sw.nw_utility.traceroute("8.8.8.8")
-        print(f"  Hops: {len(result)}")
-        for hop in result[:5]:
-            print(f"    {hop}")
+        result = board.sw.nw_utility.traceroute_host("8.8.8.8")
+        hops = result.splitlines()[1:]
+        _LOGGER.info("  Hops: %s", len(hops))
+        for hop in hops[:5]:
+            _LOGGER.info("    %s", hop)
     except Exception as e:
         pytest.skip(f"Traceroute not available: {e}")
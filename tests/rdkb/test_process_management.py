@@ -1,14 +1,18 @@
 """Tests for process management primitives on RDKB devices."""
 
+import logging
+
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+_LOGGER = logging.getLogger(__name__)
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_get_running_processes(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
+def test_get_running_processes(board):
     processes = list(board.sw.get_running_processes(ps_options="-A"))
 
     assert len(processes) > 0, "Should have at least one running process"
@@ -18,33 +22,29 @@ def test_get_running_processes(device_manager):
     for key in expected_keys:
         assert key in processes[0], f"Process should have '{key}' key"
 
-    print(f"\nTotal running processes: {len(processes)}")
-    print("\nFirst 10 processes:")
+    _LOGGER.info("Total running processes: %s", len(processes))
+    _LOGGER.info("First 10 processes:")
     for proc in processes[:10]:
-        print(f"  PID {proc['pid']:>6}: {proc['command']}")
-
+        _LOGGER.info("  PID %6s: %s", proc["pid"], proc["command"])
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_kill_process_immediately(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-    console = board.hw.get_console("console")
 
-    print("\nTesting process kill:")
+def test_kill_process_immediately(board, console):
+    _LOGGER.info("Testing process kill:")
 
     output = console.execute_command("sleep 300 & echo $!")
-    pid_line = output.strip().split("\n")[-1]
+    pid_line = output.strip().rpartition("\n")[2]
 
     try:
         pid = int(pid_line.strip())
-        print(f"  Started sleep process: PID {pid}")
+        _LOGGER.info("  Started sleep process: PID %s", pid)
 
         board.sw.kill_process_immediately(pid)
-        print(f"  OK Killed process {pid}")
+        _LOGGER.info("  OK Killed process %s", pid)
 
         import time
         time.sleep(1)
         output = console.execute_command("pgrep -f 'sleep 300' || echo 'None'")
         if "None" in output:
-            print("  OK Process successfully terminated")
+            _LOGGER.info("  OK Process successfully terminated")
     except (ValueError, IndexError):
         pytest.skip("Could not start test process")
@@ -1,93 +1,114 @@
 """Basic tests for RPI4 RDKB board."""
 
+import logging
+import re
+
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+from boardfarm3.lib.dmcli import DMCLIError
+
+_LOGGER = logging.getLogger(__name__)
+
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
+
+# Commands whose output is collected together by the sys_snapshot fixture
+_SNAPSHOT_COMMANDS = {
+    "uname": "uname -a",
+    "uptime": "uptime",
+    "memory": "cat /proc/meminfo",
+    "processes": "ps aux | head -n 2",
+}
+_SNAPSHOT_SECTION = re.compile(r"^---BF:(\w+)---\r?$", re.MULTILINE)
+# Line anchored checks on the meminfo/ps output
+_MEMORY_LINE = re.compile(r"^MemTotal:", re.MULTILINE)
+_PROCESS_LINE = re.compile(r"^\s*(?:\S+\s+)?PID\b|^root\b", re.MULTILINE)
+# Status prefix of a successful dmcli command
+_OK_PREFIX = "Execution succeed."
+# Parameters read together by the device_info_values fixture, mapped to
+# whether the parameter must have a value
+_DEVICE_INFO_PARAMS = {
+    "Device.DeviceInfo.ModelName": True,
+    "Device.DeviceInfo.SoftwareVersion": True,
+    "Device.DeviceInfo.X_COMCAST-COM_WAN_IP": False,
+}
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_terminal_width(device_manager, request):
+def setup_terminal_width(console, request):
     if request.config.getoption("--skip-boot", default=False):
-        board = device_manager.get_device_by_type(CPE)
-        console = board.hw.get_console("console")
         console.sendline("stty columns 200; export TERM=xterm")
         console.expect(console._shell_prompt, timeout=5)
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_board_accessible(device_manager):
-    board = device_manager.get_device_by_type(CPE)
-
-    console = board.hw.get_console("console")
-    output = console.execute_command("uname -a")
-
-    assert "Linux" in output, "Board should be running Linux"
-    print(f"\nBoard info: {output}")
-
-
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_board_uptime(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+@pytest.fixture(scope="module")
+def sys_snapshot(console):
+    """Run the basic system commands in a single console round-trip.
 
-    console = board.hw.get_console("console")
-    output = console.execute_command("uptime")
+    Each command output is preceded by a marker line, the combined output
+    is split on those markers into a dict keyed by command name.
+    """
+    output = console.execute_command(
+        "; ".join(
+            f"echo ---BF:{name}---; {command}"
+            for name, command in _SNAPSHOT_COMMANDS.items()
+        )
+    )
+    parts = _SNAPSHOT_SECTION.split(output)
+    return {name: section.strip() for name, section in zip(parts[1::2], parts[2::2])}
 
-    assert "load average" in output, "Uptime command should show load average"
-    print(f"\nBoard uptime: {output}")
-
-
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_board_memory(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
-    console = board.hw.get_console("console")
-    output = console.execute_command("free -m")
+@pytest.fixture(scope="module")
+def device_info_values(board):
+    """Read the DeviceInfo parameters of the dmcli tests in one console round-trip.
 
-    assert "Mem:" in output, "Should show memory information"
-    print(f"\nBoard memory:\n{output}")
+    If any parameter fails the batch is dropped and every test reads its own
+    parameter again, so the failure is only reported by the affected test.
+    """
+    try:
+        return board.sw.dmcli.GPV_batch(list(_DEVICE_INFO_PARAMS))
+    except DMCLIError:
+        return {}
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_board_processes(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+def test_board_accessible(sys_snapshot):
+    output = sys_snapshot["uname"]
 
-    console = board.hw.get_console("console")
-    output = console.execute_command("ps aux | head -n 20")
-
-    assert "PID" in output or "root" in output, "Should show process list"
-    print(f"\nBoard processes (first 20):\n{output}")
+    assert "Linux" in output, "Board should be running Linux"
+    _LOGGER.debug("Board info: %s", output)
 
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_device_info(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+def test_board_uptime(sys_snapshot):
+    output = sys_snapshot["uptime"]
 
-    result = board.sw.dmcli.GPV("Device.DeviceInfo.ModelName")
+    assert "load average" in output, "Uptime command should show load average"
+    _LOGGER.debug("Board uptime: %s", output)
 
-    assert result.status.startswith("Execution succeed."), "dmcli command should succeed"
-    assert result.rval, "ModelName should have a value"
-    print(f"\nDevice Model Name: {result.rval}")
-    print(f"Value Type: {result.rtype}")
 
+def test_board_memory(sys_snapshot):
+    output = sys_snapshot["memory"]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_software_version(device_manager):
-    board = device_manager.get_device_by_type(CPE)
+    assert _MEMORY_LINE.search(output), "Should show memory information"
+    _LOGGER.debug("Board memory:\n%s", output)
 
-    result = board.sw.dmcli.GPV("Device.DeviceInfo.SoftwareVersion")
 
-    assert result.status.startswith("Execution succeed."), "dmcli command should succeed"
-    assert result.rval, "SoftwareVersion should have a value"
-    print(f"\nSoftware Version: {result.rval}")
-    print(f"Value Type: {result.rtype}")
+def test_board_processes(sys_snapshot):
+    output = sys_snapshot["processes"]
 
+    assert _PROCESS_LINE.search(output), "Should show process list"
+    _LOGGER.debug("Board processes (header and first entry):\n%s", output)
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_dmcli_wan_status(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
-    result = board.sw.dmcli.GPV("Device.DeviceInfo.X_COMCAST-COM_WAN_IP")
+@pytest.mark.parametrize(
+    ("param", "value_required"), list(_DEVICE_INFO_PARAMS.items())
+)
+def test_dmcli_gpv(board, device_info_values, param, value_required):
+    result = device_info_values.get(param) or board.sw.dmcli.GPV(param)
 
-    assert result.status.startswith("Execution succeed."), "dmcli command should succeed"
-    print(f"\nWAN IP Address: {result.rval}")
-    print(f"Value Type: {result.rtype}")
+    assert result.status.startswith(_OK_PREFIX), "dmcli command should succeed"
+    if value_required:
+        assert result.rval, f"{param} should have a value"
+    _LOGGER.debug("%s: %s", param, result.rval)
+    _LOGGER.debug("Value Type: %s", result.rtype)
@@ -1,24 +1,30 @@
 """Tests for SNMP operations on RDKB devices."""
 
+import logging
+
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+_LOGGER = logging.getLogger(__name__)
+
+_SNMP_METHODS = frozenset({"snmpget", "snmpset", "snmpwalk", "snmpbulkget"})
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_snmp_methods_exist(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
-    if not hasattr(board.sw, 'snmp'):
+def test_snmp_methods_exist(board):
+    try:
+        snmp = board.sw.snmp
+    except AttributeError:
         pytest.skip("SNMP not available on this device")
 
-    assert hasattr(board.sw.snmp, 'snmpget'), "snmpget method should exist"
-    assert hasattr(board.sw.snmp, 'snmpset'), "snmpset method should exist"
-    assert hasattr(board.sw.snmp, 'snmpwalk'), "snmpwalk method should exist"
-    assert hasattr(board.sw.snmp, 'snmpbulkget'), "snmpbulkget method should exist"
+    missing = _SNMP_METHODS - set(dir(snmp))
+    assert not missing, f"Missing SNMP methods: {sorted(missing)}"
 
-    print("\nOK SNMP methods available:")
-    print("  - snmpget(oid)")
-    print("  - snmpset(oid, value, type)")
-    print("  - snmpwalk(oid)")
-    print("  - snmpbulkget(oid)")
+    _LOGGER.info("OK SNMP methods available:")
+    _LOGGER.info("  - snmpget(oid)")
+    _LOGGER.info("  - snmpset(oid, value, type)")
+    _LOGGER.info("  - snmpwalk(oid)")
+    _LOGGER.info("  - snmpbulkget(oid)")
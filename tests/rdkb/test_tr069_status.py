@@ -1,18 +1,19 @@
 """Tests for TR-069 status primitives on RDKB devices."""
 
+import logging
+
 import pytest
 
-from boardfarm3.templates.cpe import CPE
+_LOGGER = logging.getLogger(__name__)
 
+pytestmark = [
+    pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}}),
+    pytest.mark.xdist_group("rpi4rdkb_console"),
+]
 
-@pytest.mark.env_req({"environment_def": {"board": {"model": "bf_rpi4rdkb"}}})
-def test_tr069_connection_status(device_manager):
-    board = device_manager.get_device_by_type(CPE)
 
-    try:
-        is_connected = board.sw.is_tr069_connected()
+def test_tr069_connection_status(require_tr069):
+    is_connected = require_tr069
 
-        print(f"\nTR-069 Connection Status: {is_connected}")
-        assert isinstance(is_connected, bool), "Should return boolean"
-    except Exception as e:
-        pytest.skip(f"TR-069 status check not available: {e}")
+    _LOGGER.info("TR-069 Connection Status: %s", is_connected)
+    assert isinstance(is_connected, bool), "Should return boolean"
@@ -0,0 +1,55 @@
+"""Unit tests for cpe_sw.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from boardfarm3.lib.cpe_sw import CPESwLibraries
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+_PROC_MEMINFO = Path(__file__).parents[1] / "testdata" / "proc_meminfo"
+
+
+def test_get_memory_utilization(mocker: MockerFixture) -> None:
+    """Verify memory utilization is derived from /proc/meminfo in MiB.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    """
+    mocker.patch.object(CPESwLibraries, "__abstractmethods__", frozenset())
+    hardware = mocker.Mock()
+    hardware.get_console.return_value.execute_command.return_value = (
+        _PROC_MEMINFO.read_text()
+    )
+    assert CPESwLibraries(hardware).get_memory_utilization() == {
+        "total": 3793,
+        "used": 364,
+        "free": 3128,
+        "shared": 22,
+        "cache": 300,
+        "available": 3367,
+    }
+
+
+def test_get_board_logs_idle_timeout(mocker: MockerFixture) -> None:
+    """Verify log collection stops once the console goes idle.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    """
+    mocker.patch.object(CPESwLibraries, "__abstractmethods__", frozenset())
+    hardware = mocker.Mock()
+    console = hardware.get_console.return_value
+    chunks = iter(["line1\r\n", "line2\r\n", ""])
+
+    def _expect(*_args: object, **_kwargs: object) -> int:
+        console.before = next(chunks)
+        return 0
+
+    console.expect.side_effect = _expect
+    logs = CPESwLibraries(hardware).get_board_logs(timeout=60, idle_timeout=0.25)
+    assert logs == "line1\r\nline2\r\n"
+    assert console.expect.call_count == 3
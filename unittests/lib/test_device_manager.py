@@ -25,9 +25,12 @@ class InvalidDevice:
 @pytest.fixture(scope="function", name="device_manager")
 def device_manager_fixture() -> DeviceManager:
     try:
-        return DeviceManager(get_plugin_manager())
+        device_manager = DeviceManager(get_plugin_manager())
     except ValueError:
-        return get_device_manager()
+        device_manager = get_device_manager()
+    # the instance is shared between tests, start each one with a cold cache
+    device_manager._device_by_type_cache.clear()
+    return device_manager
 
 
 def test_device_manager_singleton(device_manager: DeviceManager) -> None:
@@ -87,6 +90,32 @@ def test_get_device_by_type_invalid_device(
         device_manager.get_device_by_type(LAN)
 
 
+def test_get_device_by_type_cached_until_unregister(
+    mocker: MockerFixture,
+    device_manager: DeviceManager,
+) -> None:
+    """Verify the device lookup is cached until a device is unregistered.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    :param device_manager: device manager instance
+    :type device_manager: DeviceManager
+    """
+    mocker.patch.object(LinuxTFTP, attribute="__init__", return_value=None)
+    tftp = LinuxTFTP({}, None)
+    list_name_plugin = mocker.patch.object(
+        PluginManager,
+        attribute="list_name_plugin",
+        return_value=[("cached_tftp", tftp)],
+    )
+    assert device_manager.get_device_by_type(LinuxTFTP) is tftp
+    assert device_manager.get_device_by_type(LinuxTFTP) is tftp
+    assert list_name_plugin.call_count == 1
+    device_manager.unregister_device("cached_tftp")
+    assert device_manager.get_device_by_type(LinuxTFTP) is tftp
+    assert list_name_plugin.call_count == 2
+
+
 def test_get_devices_by_type_valid_device(
     mocker: MockerFixture,
     device_manager: DeviceManager,
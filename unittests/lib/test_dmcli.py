@@ -0,0 +1,83 @@
+"""Unit tests for dmcli.py module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from boardfarm3.lib.dmcli import _BATCH_COMMAND_MAX_LEN, DMCLIAPI, DMCLIError
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+_GPV_MODEL_NAME = (
+    "CR component name is: eRT.com.cisco.spvtg.ccsp.CR\r\n"
+    "subsystem_prefix eRT.\r\n"
+    "getv from/to component(eRT.com.cisco.spvtg.ccsp.pam): "
+    "Device.DeviceInfo.ModelName\r\n"
+    "Execution succeed.\r\n"
+    "Parameter    1 name: Device.DeviceInfo.ModelName\r\n"
+    "               type:     string,    value: RPI4 \r\n"
+)
+
+_GPV_SOFTWARE_VERSION = (
+    "CR component name is: eRT.com.cisco.spvtg.ccsp.CR\r\n"
+    "subsystem_prefix eRT.\r\n"
+    "getv from/to component(eRT.com.cisco.spvtg.ccsp.pam): "
+    "Device.DeviceInfo.SoftwareVersion\r\n"
+    "Execution succeed.\r\n"
+    "Parameter    1 name: Device.DeviceInfo.SoftwareVersion\r\n"
+    "               type:     string,    value: rdkb-2024q1-dunfell \r\n"
+)
+
+
+def test_gpv_batch(mocker: MockerFixture) -> None:
+    """Verify all params are read in one console command.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    """
+    console = mocker.Mock()
+    console.execute_command.return_value = (
+        f"{_GPV_MODEL_NAME}---BF-DMCLI---\r\n{_GPV_SOFTWARE_VERSION}---BF-DMCLI---\r\n"
+    )
+    result = DMCLIAPI(console).GPV_batch(
+        ["Device.DeviceInfo.ModelName", "Device.DeviceInfo.SoftwareVersion"]
+    )
+    console.execute_command.assert_called_once()
+    assert result["Device.DeviceInfo.ModelName"].rval == "RPI4"
+    assert result["Device.DeviceInfo.SoftwareVersion"].rval == "rdkb-2024q1-dunfell"
+    assert result["Device.DeviceInfo.SoftwareVersion"].rtype == "string"
+
+
+def test_gpv_batch_truncated_output(mocker: MockerFixture) -> None:
+    """Verify DMCLIError is raised when the output of a param is missing.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    """
+    console = mocker.Mock()
+    console.execute_command.return_value = f"{_GPV_MODEL_NAME}---BF-DMCLI---\r\n"
+    with pytest.raises(DMCLIError):
+        DMCLIAPI(console).GPV_batch(
+            ["Device.DeviceInfo.ModelName", "Device.DeviceInfo.SoftwareVersion"]
+        )
+
+
+def test_gpv_batch_splits_long_commands(mocker: MockerFixture) -> None:
+    """Verify params are split so that no command exceeds the console width.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    """
+    params = [f"Device.DeviceInfo.VendorConfigFile.{index}.Name" for index in range(6)]
+    console = mocker.Mock()
+    console.execute_command.side_effect = lambda command, **_: (
+        f"{_GPV_MODEL_NAME}---BF-DMCLI---\r\n" * command.count("Device.")
+    )
+    result = DMCLIAPI(console).GPV_batch(params)
+    assert console.execute_command.call_count > 1
+    for call in console.execute_command.call_args_list:
+        assert len(call.args[0]) <= _BATCH_COMMAND_MAX_LEN
+    assert list(result) == params
@@ -8,6 +8,7 @@ import pytest
 
 from boardfarm3.exceptions import SCPConnectionError
 from boardfarm3.lib.networking import (
+    IptablesFirewall,
     UseCaseFailure,
     _LinuxConsole,
     dns_lookup,
@@ -34,6 +35,10 @@ _TCPDUMP_OUTPUT = _TEST_DATA / "tcpdump_output"
 
 _SCP_CONNECTION_ERROR = _TEST_DATA / "scp_conn_error"
 
+_IPTABLES_SAVE_OUTPUT = _TEST_DATA / "iptables_save"
+
+_IPTABLES_LIST_OUTPUT = _TEST_DATA / "iptables_list"
+
 
 class MyLinuxConsole(_LinuxConsole):
     """Implement protocol _LinuxConsole."""
@@ -229,3 +234,46 @@ def test_traceroute_host_v6() -> None:
         timeout=90,
     )
     assert host_ip in output
+
+
+def test_get_iptables_save() -> None:
+    """Verify iptables-save output is parsed per table and chain."""
+    tables = IptablesFirewall(
+        MyLinuxConsole(_IPTABLES_SAVE_OUTPUT.read_text())
+    ).get_iptables_save()
+    assert list(tables) == ["mangle", "nat", "filter"]
+    assert tables["nat"]["POSTROUTING"] == ["-o erouter0 -j MASQUERADE"]
+    assert tables["nat"]["PREROUTING"] == []
+    assert tables["filter"]["INPUT"][0] == "-s 192.168.99.99/32 -j DROP"
+    assert len(tables["filter"]["INPUT"]) == 3
+    assert tables["filter"]["lan2self"] == ["-p tcp -m tcp --dport 22 -j ACCEPT"]
+
+
+def test_get_ip46tables_save() -> None:
+    """Verify the combined iptables/ip6tables dump is split per family."""
+    dump = _IPTABLES_SAVE_OUTPUT.read_text()
+    ipv4, ipv6 = IptablesFirewall(
+        MyLinuxConsole(f"{dump}---BF-IP6TABLES-SAVE---\n*filter\n:INPUT ACCEPT [0:0]\n")
+    ).get_ip46tables_save()
+    assert ipv4["filter"]["INPUT"][0] == "-s 192.168.99.99/32 -j DROP"
+    assert ipv6 == {"filter": {"INPUT": []}}
+
+
+def test_get_iptables_list() -> None:
+    """Verify iptables -L output is parsed per chain."""
+    rules = IptablesFirewall(
+        MyLinuxConsole(_IPTABLES_LIST_OUTPUT.read_text())
+    ).get_iptables_list()
+    assert list(rules) == ["INPUT", "FORWARD", "OUTPUT", "lan2self"]
+    assert rules["INPUT"][0]["source"] == "192.168.99.99"
+    assert rules["INPUT"][0]["target"] == "DROP"
+    assert rules["OUTPUT"] == []
+
+
+def test_get_iptables_policy() -> None:
+    """Verify the chain policies are parsed from iptables -L output."""
+    policies = IptablesFirewall(
+        MyLinuxConsole(_IPTABLES_LIST_OUTPUT.read_text())
+    ).get_iptables_policy()
+    assert policies["INPUT"].startswith("policy DROP")
+    assert policies["OUTPUT"].startswith("policy ACCEPT")